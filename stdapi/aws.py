@@ -18,6 +18,9 @@ REGION: str = Session().region_name or SETTINGS.aws_bedrock_regions[0]
 #: Session with the default region
 SESSION = Session(region_name=SETTINGS.aws_bedrock_regions[0])
 
+#: Session default region (Resolved once: "region_name" looks up the botocore config)
+_SESSION_REGION: str = SESSION.region_name
+
 _CLIENTS: dict[str, dict[str, Any]] = {}
 
 _RETRIES = {"max_attempts": 10, "mode": "adaptive"}
@@ -55,7 +58,7 @@ class AWSConnectionManager:
         """
         await self._exit_stack.__aenter__()
         for service, region in {
-            (service, region or SESSION.region_name)
+            (service, region or _SESSION_REGION)
             for service, region in self._client_specs
         }:
             config = (
@@ -115,7 +118,7 @@ def get_client(service: str, region_name: str | None = None) -> Any:  # noqa:ANN
     """
     clients = _CLIENTS[service]
     try:
-        return clients[region_name or SESSION.region_name]
+        return clients[region_name or _SESSION_REGION]
     except KeyError:
         if len(clients) == 1:
             return next(iter(clients.values()))
@@ -10,6 +10,10 @@ from stdapi.openai_exceptions import OpenaiError
 
 if TYPE_CHECKING:
     from types_aiobotocore_s3.client import S3Client
+    from types_aiobotocore_s3.type_defs import ObjectIdentifierTypeDef
+
+#: Maximum number of keys per S3 DeleteObjects request
+_DELETE_OBJECTS_MAX_KEYS = 1000
 
 
 async def aws_s3_cleanup(
@@ -17,20 +21,37 @@ async def aws_s3_cleanup(
 ) -> None:
     """Cleanup tasks for S3 temporary resources.
 
-    To execute with FastAPI BackgroundTasks.
+    To execute with FastAPI BackgroundTasks. Objects are deleted with a single
+    DeleteObjects request per bucket.
 
     Args:
         s3_client: S3 client
         s3_objects_to_delete: List of (bucket, key) tuples to delete
         request_id: Request ID
     """
-    with log_background_event("aws_s3_cleanup", request_id):
-        await gather(
+    buckets: dict[str, list[ObjectIdentifierTypeDef]] = {}
+    for bucket, key in s3_objects_to_delete:
+        buckets.setdefault(bucket, []).append({"Key": key})
+
+    with log_background_event("aws_s3_cleanup", request_id) as log:
+        for response in await gather(
             *(
-                s3_client.delete_object(Bucket=bucket, Key=key)
-                for bucket, key in s3_objects_to_delete
+                s3_client.delete_objects(
+                    Bucket=bucket,
+                    Delete={
+                        "Objects": objects[index : index + _DELETE_OBJECTS_MAX_KEYS],
+                        "Quiet": True,
+                    },
+                )
+                for bucket, objects in buckets.items()
+                for index in range(0, len(objects), _DELETE_OBJECTS_MAX_KEYS)
             )
-        )
+        ):
+            for error in response.get("Errors", ()):
+                log["level"] = "error"
+                log.setdefault("error_detail", []).append(
+                    f"{error.get('Key')}: {error.get('Code')} {error.get('Message')}"
+                )
 
 
 async def put_object_and_get_url(body: bytes, content_type: str, filename: str) -> str:
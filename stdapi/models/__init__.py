@@ -1,10 +1,12 @@
 """Models."""
 
-from asyncio import Lock, Queue, create_task, gather, sleep
-from collections.abc import AsyncGenerator, Iterable, Mapping
+from asyncio import Lock, Queue, TaskGroup, create_task, gather, sleep
+from bisect import bisect_right, insort
+from collections.abc import AsyncGenerator, Coroutine, Iterable, Mapping
 from contextlib import suppress
 from datetime import timedelta
 from importlib import import_module
+from operator import itemgetter
 from pkgutil import iter_modules
 from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, TypeVar
 
@@ -20,6 +22,7 @@ from stdapi.config import SETTINGS
 from stdapi.models.deprecation import DEPRECATED_MODELS
 from stdapi.monitoring import REQUEST_ID, REQUEST_LOG, log_error_details
 from stdapi.openai_exceptions import OpenaiUnsupportedModelError
+from stdapi.utils import json_loads
 
 if TYPE_CHECKING:
     from types_aiobotocore_bedrock.client import BedrockClient
@@ -47,7 +50,6 @@ if TYPE_CHECKING:
         update_next: AwareDatetime | None
         update_interval: timedelta
         update_lock: Lock
-        access_lock: Lock
 
 
 #: Models details
@@ -77,17 +79,26 @@ EXTRA_MODELS_INPUT_MODALITY: dict[str, set[str]] = {}
 #: All models by input modality
 _ALL_MODELS_INPUT_MODALITY: dict[str, set[str]] = {}
 
+#: Models IDs, for Bedrock only models (True) or all models (False)
+_MODELS_IDS: dict[bool, frozenset[str]] = {True: frozenset(), False: frozenset()}
+
+#: Validated models details by (model ID, output modality, input modality, bedrock only)
+_VALIDATED_MODELS: dict[tuple[str, str | None, str | None, bool], "ModelDetails"] = {}
+
 #: Model cache configuration
 _CACHE: "_ModelCache" = {
     "update_next": None,
     "update_lock": Lock(),
     "update_interval": timedelta(seconds=SETTINGS.model_cache_seconds),
-    "access_lock": Lock(),
 }
 
 #: Always allowed inference types
 _INFERENCE_TYPES = {"INFERENCE_PROFILE", "ON_DEMAND"}
 
+#: Async invocation status polling: initial and maximum delay in seconds
+_ASYNC_INVOKE_POLL_DELAY_MIN = 0.1
+_ASYNC_INVOKE_POLL_DELAY_MAX = 5.0
+
 
 class ModelDetails(BaseModel):
     """Model details and features."""
@@ -169,8 +180,8 @@ class ModelBase[RequestT, ResponseT]:
         Returns:
             The result of the invoked operation.
         """
-        return await gather(
-            *(self.invoke(body, inference_profile=inference_profile) for body in bodies)
+        return await gather_or_cancel(
+            self.invoke(body, inference_profile=inference_profile) for body in bodies
         )
 
     async def invoke_stream(
@@ -233,13 +244,11 @@ class ModelBase[RequestT, ResponseT]:
         Returns:
             The results of the invoked operations.
         """
-        return await gather(
-            *(
-                self.invoke_async(
-                    body, background_tasks, inference_profile=inference_profile
-                )
-                for body in bodies
+        return await gather_or_cancel(
+            self.invoke_async(
+                body, background_tasks, inference_profile=inference_profile
             )
+            for body in bodies
         )
 
     async def batch_invoke_stream(
@@ -307,6 +316,34 @@ class ModelBase[RequestT, ResponseT]:
             await gen.aclose()
 
 
+async def gather_or_cancel[ResultT](
+    coroutines: Iterable[Coroutine[Any, Any, ResultT]],
+) -> list[ResultT]:
+    """Run coroutines concurrently and return their results in order.
+
+    Unlike "gather", if a coroutine fails, all other coroutines are cancelled
+    instead of being left running in the background.
+
+    Args:
+        coroutines: Coroutines to run.
+
+    Returns:
+        Coroutines results.
+
+    Raises:
+        Exception: The first exception raised by a coroutine.
+    """
+    try:
+        async with TaskGroup() as group:
+            tasks = [group.create_task(coroutine) for coroutine in coroutines]
+    except ExceptionGroup as error_group:
+        error = error_group.exceptions[0]
+    else:
+        return [task.result() for task in tasks]
+    # Raised outside the "except" block to keep the original cause unchanged
+    raise error
+
+
 ModelT = TypeVar("ModelT", bound=ModelBase[Any, Any])
 
 
@@ -322,8 +359,7 @@ async def get_model_details(model_id: str) -> ModelDetails:
     Raises:
         KeyError: If the model is not found.
     """
-    async with _CACHE["access_lock"]:
-        return _MODELS[model_id]
+    return _MODELS[model_id]
 
 
 async def get_all_models_details() -> dict[str, ModelDetails]:
@@ -332,8 +368,7 @@ async def get_all_models_details() -> dict[str, ModelDetails]:
     Returns:
         All models details.
     """
-    async with _CACHE["access_lock"]:
-        return _ALL_MODELS
+    return _ALL_MODELS
 
 
 async def get_all_models_details_and_modalities() -> tuple[
@@ -344,8 +379,7 @@ async def get_all_models_details_and_modalities() -> tuple[
     Returns:
         All models details.
     """
-    async with _CACHE["access_lock"]:
-        return _ALL_MODELS, _ALL_MODELS_OUTPUT_MODALITY, _ALL_MODELS_INPUT_MODALITY
+    return _ALL_MODELS, _ALL_MODELS_OUTPUT_MODALITY, _ALL_MODELS_INPUT_MODALITY
 
 
 def update_unified_models_collections() -> None:
@@ -362,6 +396,8 @@ def update_unified_models_collections() -> None:
     """
     _ALL_MODELS.clear()
     _ALL_MODELS.update(_MODELS | EXTRA_MODELS)
+    _MODELS_IDS[False] = frozenset(_ALL_MODELS)
+    _VALIDATED_MODELS.clear()
 
     _ALL_MODELS_OUTPUT_MODALITY.clear()
     _ALL_MODELS_OUTPUT_MODALITY.update(_MODELS_OUTPUT_MODALITY)
@@ -508,6 +544,16 @@ async def _get_bedrock_models_from_region(region: str) -> list[ModelDetails]:
     ]
 
 
+def _is_models_cache_expired() -> bool:
+    """Check if the Bedrock models cache must be refreshed.
+
+    Returns:
+        True if the cache was never initialized or is expired.
+    """
+    update_next = _CACHE["update_next"]
+    return update_next is None or update_next <= SETTINGS.now()
+
+
 async def initialize_bedrock_models() -> tuple[bool, dict[str, dict[str, list[str]]]]:
     """Get all available Bedrock models from all configured regions.
 
@@ -516,8 +562,12 @@ async def initialize_bedrock_models() -> tuple[bool, dict[str, dict[str, list[st
     """
     updated = False
     unavailable_models: dict[str, dict[str, list[str]]] = {}
+    if not _is_models_cache_expired():
+        # Cache is fresh: return without queuing on the update lock
+        return updated, unavailable_models
     async with _CACHE["update_lock"]:
-        if _CACHE["update_next"] is None or _CACHE["update_next"] <= SETTINGS.now():
+        # Concurrent callers wait for the single in-progress refresh to complete
+        if _is_models_cache_expired():
             regions = SETTINGS.aws_bedrock_regions
             region_models = await gather(
                 *(_get_bedrock_models_from_region(region) for region in regions)
@@ -534,33 +584,49 @@ async def initialize_bedrock_models() -> tuple[bool, dict[str, dict[str, list[st
                     )
                 )
 
-            models_input: dict[str, set[str]] = {}
-            models_output: dict[str, set[str]] = {}
-            for model_id in sorted(all_models):
-                for modality in all_models[model_id].output_modalities:
-                    models_output.setdefault(modality.upper(), set()).add(model_id)
-                for modality in all_models[model_id].input_modalities:
-                    models_input.setdefault(modality.upper(), set()).add(model_id)
-
-            async with _CACHE["access_lock"]:
-                if all_models != _MODELS:
-                    _MODELS.clear()
-                    _MODELS.update(all_models)
-                    updated = True
-                if models_output != _MODELS_OUTPUT_MODALITY:
-                    _MODELS_OUTPUT_MODALITY.clear()
-                    _MODELS_OUTPUT_MODALITY.update(models_output)
-                    updated = True
-                if models_input != _MODELS_INPUT_MODALITY:
-                    _MODELS_INPUT_MODALITY.clear()
-                    _MODELS_INPUT_MODALITY.update(models_input)
-                    updated = True
-                if updated and _CACHE["update_next"] is not None:
-                    update_unified_models_collections()
+            # Collections are updated without awaiting, so readers never see a
+            # partially updated state and do not require a lock
+            updated = _update_bedrock_models_collections(all_models)
+            if updated and _CACHE["update_next"] is not None:
+                update_unified_models_collections()
             _CACHE["update_next"] = SETTINGS.now() + _CACHE["update_interval"]
     return updated, unavailable_models
 
 
+def _update_bedrock_models_collections(all_models: dict[str, ModelDetails]) -> bool:
+    """Update Bedrock models collections.
+
+    Args:
+        all_models: All available Bedrock models.
+
+    Returns:
+        True if the collections were updated.
+    """
+    models_input: dict[str, set[str]] = {}
+    models_output: dict[str, set[str]] = {}
+    for model_id in sorted(all_models):
+        for modality in all_models[model_id].output_modalities:
+            models_output.setdefault(modality.upper(), set()).add(model_id)
+        for modality in all_models[model_id].input_modalities:
+            models_input.setdefault(modality.upper(), set()).add(model_id)
+
+    updated = False
+    if all_models != _MODELS:
+        _MODELS.clear()
+        _MODELS.update(all_models)
+        _MODELS_IDS[True] = frozenset(_MODELS)
+        updated = True
+    if models_output != _MODELS_OUTPUT_MODALITY:
+        _MODELS_OUTPUT_MODALITY.clear()
+        _MODELS_OUTPUT_MODALITY.update(models_output)
+        updated = True
+    if models_input != _MODELS_INPUT_MODALITY:
+        _MODELS_INPUT_MODALITY.clear()
+        _MODELS_INPUT_MODALITY.update(models_input)
+        updated = True
+    return updated
+
+
 async def _filter_model(
     bedrock_client: "BedrockClient",
     model: ModelDetails,
@@ -616,6 +682,10 @@ async def _filter_model(
             ]
 
 
+#: Models classes registry sort key
+_MATCHER_KEY = itemgetter(0)
+
+
 def load_model_plugins(
     package_name: str,
     class_type: type[ModelT],
@@ -623,6 +693,8 @@ def load_model_plugins(
 ) -> None:
     """Import all modules in the specified package and auto-register model classes.
 
+    The registry is kept sorted by matcher to allow a binary search lookup.
+
     Args:
         package_name: Package name under which to import the model
         class_type: Class name under which to import the model
@@ -642,11 +714,11 @@ def load_model_plugins(
             raise ImportError(msg) from None
 
         matcher = getattr(cls, "MATCHER", None)
-        if not matcher:  # pragma: no cover
-            msg = f"{class_name} {cls} has no MATCHER"
+        if not matcher or not isinstance(matcher, str):  # pragma: no cover
+            msg = f"{class_name} {cls} has no MATCHER model ID prefix"
             raise ImportError(msg) from None
 
-        registry.append((matcher, cls))
+        insort(registry, (matcher, cls), key=_MATCHER_KEY)
 
 
 def get_model(
@@ -668,10 +740,17 @@ def get_model(
     try:
         return cache[model_id]
     except KeyError:
-        for matcher, model_cls in registry:
+        # Matching prefixes sort just before the model ID: walk back from the
+        # insertion point until a match or a matcher with another first letter
+        index = bisect_right(registry, model_id, key=_MATCHER_KEY)
+        while index:
+            index -= 1
+            matcher, model_cls = registry[index]
             if model_id.startswith(matcher):
                 cache[model_id] = model_cls(model_id)
                 return cache[model_id]
+            if matcher[:1] != model_id[:1]:
+                break
     raise OpenaiUnsupportedModelError(model_id)
 
 
@@ -731,7 +810,7 @@ async def invoke_json(
     )
     with handle_bedrock_client_error():
         response = await bedrock_client.invoke_model(**kwargs)
-    return from_json(await response["body"].read())  # type: ignore[no-any-return]
+    return await json_loads(await response["body"].read())  # type: ignore[return-value]
 
 
 async def invoke_json_stream(
@@ -835,44 +914,76 @@ async def validate_model(
         HTTPException: If model is not found or not supported
     """
     # First, try to get the model from the cache
-    models = _MODELS if bedrock_only else _ALL_MODELS
-    async with _CACHE["access_lock"]:
-        try:
-            model = models[model_id]
-        except KeyError:
-            model = None
+    model = _resolve_validated(
+        model_id, output_modality, input_modality, bedrock_only=bedrock_only
+    )
 
     # If not found, update the cache and retry, if still not found, raise an error
     if model is None:
         await initialize_bedrock_models()
-        async with _CACHE["access_lock"]:
-            try:
-                model = models[model_id]
-            except KeyError:
-                try:
-                    msg = (
-                        f"Model '{model_id}' not found. "
-                        f"This model is deprecated or pending deprecation, "
-                        f"please use '{DEPRECATED_MODELS[model_id]}' instead."
-                    )
-                except KeyError:
-                    msg = f"Model '{model_id}' not found."
-                model_ids = set(models)
-                if input_modality:
-                    model_ids &= (
-                        _MODELS_INPUT_MODALITY
-                        if bedrock_only
-                        else _ALL_MODELS_INPUT_MODALITY
-                    )[input_modality]
-                if output_modality:
-                    model_ids &= (
-                        _MODELS_OUTPUT_MODALITY
-                        if bedrock_only
-                        else _ALL_MODELS_OUTPUT_MODALITY
-                    )[output_modality]
-                raise OpenaiUnsupportedModelError(
-                    msg, available_models=model_ids
-                ) from None
+        model = _resolve_validated(
+            model_id, output_modality, input_modality, bedrock_only=bedrock_only
+        )
+        if model is None:
+            replacement = DEPRECATED_MODELS.get(model_id)
+            msg = (
+                f"Model '{model_id}' not found. "
+                f"This model is deprecated or pending deprecation, "
+                f"please use '{replacement}' instead."
+                if replacement
+                else f"Model '{model_id}' not found."
+            )
+            model_ids = _MODELS_IDS[bedrock_only]
+            if input_modality:
+                model_ids &= (
+                    _MODELS_INPUT_MODALITY
+                    if bedrock_only
+                    else _ALL_MODELS_INPUT_MODALITY
+                ).get(input_modality, frozenset())
+            if output_modality:
+                model_ids &= (
+                    _MODELS_OUTPUT_MODALITY
+                    if bedrock_only
+                    else _ALL_MODELS_OUTPUT_MODALITY
+                ).get(output_modality, frozenset())
+            raise OpenaiUnsupportedModelError(msg, available_models=model_ids)
+
+    log = REQUEST_LOG.get()
+    log["model_id"] = model_id
+    return model
+
+
+def _resolve_validated(
+    model_id: str,
+    output_modality: str | None,
+    input_modality: str | None,
+    *,
+    bedrock_only: bool,
+) -> ModelDetails | None:
+    """Return the model details if the model exists and supports the modalities.
+
+    Successful validations are cached until the models collections are updated.
+
+    Args:
+        model_id: Model ID to validate
+        output_modality: Expected output modality.
+        input_modality: Expected input modality.
+        bedrock_only: If True, only allow Bedrock models.
+
+    Returns:
+        The model details, or None if the model is not found.
+
+    Raises:
+        HTTPException: If the model does not support the modalities.
+    """
+    key = (model_id, output_modality, input_modality, bedrock_only)
+    model = _VALIDATED_MODELS.get(key)
+    if model is not None:
+        return model
+
+    model = (_MODELS if bedrock_only else _ALL_MODELS).get(model_id)
+    if model is None:
+        return None
 
     # Check model modalities
     if output_modality and output_modality not in model.output_modalities:
@@ -885,8 +996,7 @@ async def validate_model(
             status_code=400,
             detail=f"Model '{model_id}' does not support {input_modality.lower()} input modality.",
         )
-    log = REQUEST_LOG.get()
-    log["model_id"] = model_id
+    _VALIDATED_MODELS[key] = model
     return model
 
 
@@ -895,6 +1005,9 @@ async def _wait_for_async_invocation_completion(
 ) -> str:
     """Wait for async invocation to complete.
 
+    The status is polled with an exponential backoff, so short jobs are detected
+    quickly while long jobs do not flood the Bedrock API.
+
     Args:
         bedrock_client: Bedrock Runtime client
         invocation_arn: Async invocation ARN
@@ -905,6 +1018,7 @@ async def _wait_for_async_invocation_completion(
     Raises:
         HTTPException: If invocation fails
     """
+    delay = _ASYNC_INVOKE_POLL_DELAY_MIN
     while True:  # Timeout at FastAPI level
         response = await bedrock_client.get_async_invoke(invocationArn=invocation_arn)
         status = response["status"]
@@ -912,11 +1026,12 @@ async def _wait_for_async_invocation_completion(
             return (
                 response["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"]
                 .removeprefix("s3://")
-                .split("/", 1)[1]
+                .partition("/")[2]
             )
         if status == "Failed":
             raise HTTPException(status_code=400, detail=response["failureMessage"])
-        await sleep(0.5)
+        await sleep(delay)
+        delay = min(delay * 2, _ASYNC_INVOKE_POLL_DELAY_MAX)
 
 
 async def invoke_json_async(
@@ -972,7 +1087,7 @@ async def invoke_json_async(
         s3_tmp_objects.extend(
             ((s3_bucket, s3_output), (s3_bucket, f"{s3_key}/manifest.json"))
         )
-        return from_json(  # type: ignore[no-any-return]
+        return await json_loads(  # type: ignore[return-value]
             await (await s3_client.get_object(Bucket=s3_bucket, Key=s3_output))[
                 "Body"
             ].read()
@@ -985,6 +1100,14 @@ async def invoke_json_async(
             )
 
 
+#: S3 buckets by region, regional buckets take precedence over the default bucket
+_S3_BUCKETS: dict[str, str] = (
+    {SETTINGS.aws_bedrock_regions[0]: SETTINGS.aws_s3_bucket}
+    if SETTINGS.aws_s3_bucket
+    else {}
+) | SETTINGS.aws_s3_regional_buckets
+
+
 def get_model_s3_bucket(model: ModelDetails) -> "tuple[str, S3Client]":
     """Retrieve the S3 bucket and S3 client for a given model's region.
 
@@ -1007,11 +1130,9 @@ def get_model_s3_bucket(model: ModelDetails) -> "tuple[str, S3Client]":
         error message.
     """
     try:
-        s3_bucket = SETTINGS.aws_s3_regional_buckets[model.region]
+        s3_bucket = _S3_BUCKETS[model.region]
     except KeyError as error:
         if model.region == SETTINGS.aws_bedrock_regions[0]:
-            if SETTINGS.aws_s3_bucket:
-                return SETTINGS.aws_s3_bucket, get_client("s3")
             log_error_details(
                 "S3 bucket not configured (aws_s3_bucket): some features are disabled"
             )
@@ -7,9 +7,9 @@ identifier.
 
 Design:
 - Model modules expose a class named `EmbeddingModel` with a class variable
-  `MATCHER` containing a string prefix or compiled regex matching model
-  identifiers.
-- The package auto-loads and registers these classes once on import.
+  `MATCHER` containing a string prefix matching model identifiers.
+- The package auto-loads and registers these classes once on import, sorted by
+  matcher, so identifiers are resolved with a binary search.
 """
 
 from abc import abstractmethod
@@ -24,6 +24,9 @@ from stdapi.models import ModelBase, RequestT, ResponseT, get_model, load_model_
 class EmbeddingResponse(BaseModel):
     """Embedding response.
 
+    Models build it with ``model_construct`` from provider responses: vectors
+    are validated once when serialized in the OpenAI response.
+
     Attributes:
         embeddings: List of embedding vectors (one per input).
         total_tokens: Total token count reported by the provider (if available).
@@ -5,14 +5,13 @@
 - amazon.titan-embed-text-v2:0
 """
 
-from contextlib import suppress
 from typing import Literal, NotRequired, TypedDict
 
 from fastapi import BackgroundTasks
 from pydantic import JsonValue
 
 from stdapi.models.embedding import EmbeddingModelBase, EmbeddingResponse
-from stdapi.utils import is_data_uri
+from stdapi.utils import get_data_uri_data
 
 
 class _EmbeddingConfig(TypedDict):
@@ -83,15 +82,25 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
         request.update(extra_params)  # type:ignore[typeddict-item]
         if dimensions:
             request["dimensions"] = dimensions
-        input_tokens = 0
-        embeddings = []
-        for response in await self.batch_invoke(
-            _Request(inputImage=value.split(",", 1)[1], **request)
-            if is_data_uri(value)
-            else _Request(inputText=value, **request)
-            for value in inputs
-        ):
-            embeddings.append(response["embedding"])
-            with suppress(KeyError):
-                input_tokens += int(response["inputTextTokenCount"])
-        return EmbeddingResponse(embeddings=embeddings, prompt_tokens=input_tokens)
+
+        # Identical inputs are embedded only once
+        unique_inputs = dict.fromkeys(inputs)
+        unique_responses = dict(
+            zip(
+                unique_inputs,
+                await self.batch_invoke(
+                    _Request(inputText=value, **request)
+                    if (data := get_data_uri_data(value)) is None
+                    else _Request(inputImage=data, **request)
+                    for value in unique_inputs
+                ),
+                strict=True,
+            )
+        )
+        responses = [unique_responses[value] for value in inputs]
+        return EmbeddingResponse.model_construct(
+            embeddings=[response["embedding"] for response in responses],
+            prompt_tokens=sum(
+                int(response.get("inputTextTokenCount", 0)) for response in responses
+            ),
+        )
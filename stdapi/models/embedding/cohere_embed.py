@@ -109,19 +109,29 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
         Returns:
             Embedding response.
         """
+        is_data = [is_data_uri(input_str) for input_str in inputs]
+        data_count = is_data.count(True)
+
+        # Only text inputs are tokenized, images tokens cannot be estimated
+        token_task = create_task(
+            estimate_token_count(
+                *(
+                    value
+                    for value, data in zip(inputs, is_data, strict=True)
+                    if not data
+                )
+            )
+        )
         request = _Request(input_type="search_document")
         request.update(extra_params)  # type:ignore[typeddict-item]
         if dimensions is not None:
             request["output_dimension"] = dimensions
 
-        is_data: tuple[bool, ...] = tuple(
-            is_data_uri(input_str) for input_str in inputs
-        )
-        if all(is_data):
+        if data_count == len(is_data):
             request["images"] = inputs
             if self._model_id.endswith("v3"):
                 request["input_type"] = "image"
-        elif any(is_data):
+        elif data_count:
             request["inputs"] = [
                 _InputContent(
                     content=[
@@ -137,12 +147,11 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
         else:
             request["texts"] = inputs
 
-        token_task = create_task(estimate_token_count(*inputs))
         embeddings = (await self.invoke(request))["embeddings"]
         if isinstance(embeddings, dict):
             embeddings = embeddings["float"]
         estimated_tokens = await token_task or 0
-        return EmbeddingResponse(
+        return EmbeddingResponse.model_construct(
             embeddings=embeddings,
             prompt_tokens=estimated_tokens,
             total_tokens=estimated_tokens,
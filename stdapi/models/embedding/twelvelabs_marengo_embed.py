@@ -3,13 +3,15 @@
 - twelvelabs.marengo-embed-2-7-v1:0
 """
 
-from asyncio import create_task, gather
-from collections.abc import Awaitable
-from typing import Literal, NotRequired, TypedDict
+from asyncio import create_task
+from collections.abc import Coroutine
+from itertools import chain
+from typing import Any, Literal, NotRequired, TypedDict
 
 from fastapi import BackgroundTasks, HTTPException
 from pydantic import JsonValue
 
+from stdapi.models import gather_or_cancel
 from stdapi.models.embedding import EmbeddingModelBase, EmbeddingResponse
 from stdapi.openai_exceptions import OpenaiError
 from stdapi.tokenizer import estimate_token_count
@@ -89,10 +91,11 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
                 status_code=400,
                 detail="'dimensions' option is not supported by TwelveLabs Marengo embedding models.",
             )
-        token_task = create_task(estimate_token_count(*inputs))
-        embeddings: list[list[float]] = []
+        # Identical inputs are embedded only once
+        unique_inputs = dict.fromkeys(inputs)
+        texts: set[str] = set()
         tasks = []
-        for value in inputs:
+        for value in unique_inputs:
             data_type = get_data_uri_type(value)
             if data_type == "text/plain":
                 if value.startswith("s3://"):
@@ -100,6 +103,7 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
                         self._handle_s3_media(value, extra_params, background_tasks)
                     )
                 else:
+                    texts.add(value)
                     tasks.append(self._handle_text(value, extra_params))
             elif data_type.startswith("image"):
                 tasks.append(self._handle_image(value, extra_params))
@@ -110,10 +114,19 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
                     )
                 )
 
-        for response in await gather(*tasks):
-            embeddings.extend(vector["embedding"] for vector in response["data"])
+        # Only text inputs are tokenized, media tokens cannot be estimated
+        token_task = create_task(
+            estimate_token_count(*(value for value in inputs if value in texts))
+        )
+        responses = dict(zip(unique_inputs, await gather_or_cancel(tasks), strict=True))
+        embeddings = [
+            vector["embedding"]
+            for vector in chain.from_iterable(
+                responses[value]["data"] for value in inputs
+            )
+        ]
         estimated_tokens = await token_task or 0
-        return EmbeddingResponse(
+        return EmbeddingResponse.model_construct(
             embeddings=embeddings,
             prompt_tokens=estimated_tokens,
             total_tokens=estimated_tokens,
@@ -121,7 +134,7 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
 
     def _handle_text(
         self, value: str, extra_params: dict[str, JsonValue]
-    ) -> Awaitable[_Response]:
+    ) -> Coroutine[Any, Any, _Response]:
         """Handles an text input.
 
         Args:
@@ -132,13 +145,13 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
             An awaitable response object corresponding
             to the processed text request.
         """
-        request = _Request(inputType="text", inputText=value)
+        request: _Request = {"inputType": "text", "inputText": value}
         request.update(extra_params)  # type:ignore[typeddict-item]
         return self.invoke(request)
 
     def _handle_image(
         self, value: str, extra_params: dict[str, JsonValue]
-    ) -> Awaitable[_Response]:
+    ) -> Coroutine[Any, Any, _Response]:
         """Handles an image input.
 
         Args:
@@ -149,10 +162,10 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
             An awaitable response object corresponding
             to the processed image request.
         """
-        request = _Request(
-            inputType="image",
-            mediaSource=_MediaSource(base64String=value.split(",", 1)[1]),
-        )
+        request: _Request = {
+            "inputType": "image",
+            "mediaSource": {"base64String": value.partition(",")[2]},
+        }
         request.update(extra_params)  # type:ignore[typeddict-item]
         return self.invoke(request)
 
@@ -162,7 +175,7 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
         data_type: str,
         extra_params: dict[str, JsonValue],
         background_tasks: BackgroundTasks,
-    ) -> Awaitable[_Response]:
+    ) -> Coroutine[Any, Any, _Response]:
         """Handles media requiring asynchronous processing.
 
         Args:
@@ -174,10 +187,10 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
         Returns:
             An awaitable object that resolves to the response of the media processing request.
         """
-        request = _Request(
-            inputType=data_type.split("/", 1)[0],  # type: ignore[typeddict-item]
-            mediaSource=_MediaSource(base64String=value.split(",", 1)[1]),
-        )
+        request: _Request = {
+            "inputType": data_type.partition("/")[0],  # type: ignore[typeddict-item]
+            "mediaSource": {"base64String": value.partition(",")[2]},
+        }
         request.update(extra_params)  # type:ignore[typeddict-item]
         return self.invoke_async(
             request, background_tasks=background_tasks, inference_profile=False
@@ -188,7 +201,7 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
         value: str,
         extra_params: dict[str, JsonValue],
         background_tasks: BackgroundTasks,
-    ) -> Awaitable[_Response]:
+    ) -> Coroutine[Any, Any, _Response]:
         """Handles the processing of S3 media asynchronously.
 
         Args:
@@ -210,10 +223,10 @@ class EmbeddingModel(EmbeddingModelBase[_Request, _Response]):
         except ValueError as error:
             raise OpenaiError(error.args[0]) from error
 
-        request = _Request(
-            inputType=input_type,
-            mediaSource=_MediaSource(s3Location=_MediaSourceS3Location(uri=value)),
-        )
+        request: _Request = {
+            "inputType": input_type,
+            "mediaSource": {"s3Location": {"uri": value}},
+        }
         request.update(extra_params)  # type:ignore[typeddict-item]
         return self.invoke_async(
             request, background_tasks=background_tasks, inference_profile=False
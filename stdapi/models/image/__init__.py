@@ -7,9 +7,9 @@ identifier.
 
 Design:
 - Model modules expose a class named `ImageGenerationModel` with a class variable
-  `MATCHER` containing a string prefix or compiled regex matching model
-  identifiers.
-- The package auto-loads and registers these classes once on import.
+  `MATCHER` containing a string prefix matching model identifiers.
+- The package auto-loads and registers these classes once on import, sorted by
+  matcher, so identifiers are resolved with a binary search.
 """
 
 from abc import ABC, abstractmethod
@@ -29,6 +29,9 @@ from stdapi.utils import b64decode, convert_base64_image, get_base64_image_size
 class ImageGenerationResponse(BaseModel):
     """Image generation response.
 
+    Models build it with ``model_construct`` from provider responses: fields are
+    already typed, and the job mutates the image in place afterward.
+
     Attributes:
         images: base64 encoded image.
         partial: true if partial image.
@@ -172,14 +175,16 @@ class ImageGenerationJobBase[ImageModelT: "ImageModelBase[Any, Any, Any]"](ABC):
             Images.
         """
         async for result in self._generate_images_stream(partial_images):
-            yield await self._ensure_image_output_format(result)
+            yield result
 
     @abstractmethod
-    async def _generate_images(self) -> Iterable[Awaitable[ImageGenerationResponse]]:
+    async def _generate_images(
+        self,
+    ) -> Iterable[Awaitable[ImageGenerationResponse] | ImageGenerationResponse]:
         """Generate images from text prompt.
 
         Yields:
-            Images.
+            Images, or awaitables for images that still require model calls.
         """
 
     async def _generate_images_stream(
@@ -192,7 +197,7 @@ class ImageGenerationJobBase[ImageModelT: "ImageModelBase[Any, Any, Any]"](ABC):
             partial_images: Number of partial images to generate during streaming.
 
         Yields:
-            Streamed images.
+            Streamed images, in the requested output format.
         """
         for result in as_completed(
             self._ensure_image_output_format(result)
@@ -230,8 +235,8 @@ class ImageGenerationJobBase[ImageModelT: "ImageModelBase[Any, Any, Any]"](ABC):
                 self._response_width = result[1]
                 self._response_height = result[2]
 
-        # Get size from the image if unknown
-        else:
+        # Get size from the image if unknown, only once for all images
+        elif self._response_width == 0 or self._response_height == 0:
             async with self._size_lock:
                 if self._response_width == 0 or self._response_height == 0:
                     (
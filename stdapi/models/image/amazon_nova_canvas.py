@@ -3,8 +3,8 @@
 - amazon.nova-canvas-v1:0
 """
 
-from collections.abc import Awaitable, Iterable
-from typing import Literal, NotRequired, TypedDict
+from collections.abc import Iterable
+from typing import Literal, NotRequired, TypedDict, get_args
 
 from fastapi import HTTPException
 
@@ -19,24 +19,29 @@ from stdapi.models.image.amazon_titan_image_generator import (
     random_seed,
 )
 
+_Style = Literal[
+    "3D_ANIMATED_FAMILY_FILM",
+    "DESIGN_SKETCH",
+    "FLAT_VECTOR_ILLUSTRATION",
+    "GRAPHIC_NOVEL_ILLUSTRATION",
+    "MAXIMALISM",
+    "MIDCENTURY_RETRO",
+    "PHOTOREALISM",
+    "SOFT_DIGITAL_PAINTING",
+]
+
+# Supported styles by uppercase and lowercase names
+_STYLES: dict[str, _Style] = {
+    name: style for style in get_args(_Style) for name in (style, style.lower())
+}
+
 
 class _TextToImageParams(TypedDict):
     """Text-to-image parameters."""
 
     text: str  # Required: 1-1024 characters
     negativeText: NotRequired[str]  # Optional: 1-1024 characters
-    style: NotRequired[
-        Literal[
-            "3D_ANIMATED_FAMILY_FILM",
-            "DESIGN_SKETCH",
-            "FLAT_VECTOR_ILLUSTRATION",
-            "GRAPHIC_NOVEL_ILLUSTRATION",
-            "MAXIMALISM",
-            "MIDCENTURY_RETRO",
-            "PHOTOREALISM",
-            "SOFT_DIGITAL_PAINTING",
-        ]
-    ]
+    style: NotRequired[_Style]
     # Image conditioning parameters
     conditionImage: NotRequired[str]  # Base64 encoded image
     controlMode: NotRequired[Literal["CANNY_EDGE", "SEGMENTATION"]]
@@ -209,7 +214,7 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
     """Image generation job."""
 
     @staticmethod
-    async def _get_image_from_response(
+    def _get_image_from_response(
         image_base64: str, index: int
     ) -> ImageGenerationResponse:
         """Get image response from model response.
@@ -221,33 +226,26 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
         Response:
             Image response.
         """
-        return ImageGenerationResponse(image=image_base64, index=index)
+        return ImageGenerationResponse.model_construct(image=image_base64, index=index)
 
-    async def _generate_images(self) -> Iterable[Awaitable[ImageGenerationResponse]]:
+    async def _generate_images(self) -> Iterable[ImageGenerationResponse]:
         """Generate images from text prompt.
 
         Yields:
             Images.
         """
-        request = _Request(
-            taskType="TEXT_IMAGE",
-            textToImageParams=_TextToImageParams(text=self._prompt),
-            imageGenerationConfig=_ImageGenerationConfig(
-                width=self._width,
-                height=self._height,
-                numberOfImages=self._count,
-                seed=random_seed(),
-            ),
-        )
+        params: _TextToImageParams = {"text": self._prompt}
+        config: _ImageGenerationConfig = {
+            "width": self._width,
+            "height": self._height,
+            "numberOfImages": self._count,
+            "seed": random_seed(),
+        }
         if self._extra_params:
             if "textToImageParams" in self._extra_params:
-                request["textToImageParams"].update(
-                    self._extra_params["textToImageParams"]  # type:ignore[typeddict-item]
-                )
+                params |= self._extra_params["textToImageParams"]  # type:ignore[typeddict-item]
             if "imageGenerationConfig" in self._extra_params:
-                request["imageGenerationConfig"].update(
-                    self._extra_params["imageGenerationConfig"]  # type:ignore[typeddict-item]
-                )
+                config |= self._extra_params["imageGenerationConfig"]  # type:ignore[typeddict-item]
 
         self._response_height = self._height
         self._response_width = self._width
@@ -255,16 +253,22 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
 
         amz_quality = get_amz_quality(self._quality)
         if amz_quality:
-            request["imageGenerationConfig"]["quality"] = amz_quality
+            config["quality"] = amz_quality
             self._response_quality = "high" if amz_quality == "premium" else "medium"
 
         if self._style:
-            request["textToImageParams"]["style"] = self._style.upper()  # type: ignore[typeddict-item]
-
-        response = await self._model.invoke(request)
+            params["style"] = _STYLES.get(self._style) or self._style.upper()  # type: ignore[typeddict-item]
+
+        response = await self._model.invoke(
+            {
+                "taskType": "TEXT_IMAGE",
+                "textToImageParams": params,
+                "imageGenerationConfig": config,
+            }
+        )
         if "error" in response:
             raise HTTPException(status_code=400, detail=response["error"])
-        return tuple(
+        return (
             self._get_image_from_response(image, index)
             for index, image in enumerate(response["images"])
         )
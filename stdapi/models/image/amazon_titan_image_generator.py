@@ -4,8 +4,8 @@
 - amazon.titan-image-generator-v2:0
 """
 
-from collections.abc import Awaitable, Iterable
-from secrets import randbelow
+from collections.abc import Iterable
+from os import urandom
 from typing import Literal, NotRequired, TypedDict
 
 from fastapi import HTTPException
@@ -46,17 +46,24 @@ def get_amz_quality(quality: ImageOutputQuality | str | None) -> AmzQuality | No
     """
     if quality is None:
         return None
-    quality = quality.lower()
-    return AMZ_QUALITY_MAP.get(quality, quality)  # type: ignore[no-any-return,call-overload]
+    # Lowercase OpenAI qualities are mapped without allocating a new string
+    amz_quality = AMZ_QUALITY_MAP.get(quality)  # type: ignore[call-overload]
+    if amz_quality is None:
+        quality = quality.lower()
+        amz_quality = AMZ_QUALITY_MAP.get(quality, quality)  # type: ignore[call-overload]
+    return amz_quality  # type: ignore[no-any-return]
 
 
 def random_seed() -> int:
     """Generate a random seed value.
 
+    The seed only needs to vary between requests, so a single 32-bit random read
+    is used rather than the rejection sampling of "secrets.randbelow".
+
     Returns:
         Seed
     """
-    return randbelow(2147483646)
+    return int.from_bytes(urandom(4)) % 2147483646
 
 
 class _TextToImageParams(TypedDict):
@@ -100,7 +107,7 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
     """Image generation job."""
 
     @staticmethod
-    async def _get_image_from_response(
+    def _get_image_from_response(
         image_base64: str, index: int
     ) -> ImageGenerationResponse:
         """Get image response from model response.
@@ -112,9 +119,9 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
         Response:
             Image response.
         """
-        return ImageGenerationResponse(image=image_base64, index=index)
+        return ImageGenerationResponse.model_construct(image=image_base64, index=index)
 
-    async def _generate_images(self) -> Iterable[Awaitable[ImageGenerationResponse]]:
+    async def _generate_images(self) -> Iterable[ImageGenerationResponse]:
         """Generate images from text prompt.
 
         Yields:
@@ -126,20 +133,14 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
                 detail='"style" parameter is not supported by this model.',
             )
 
-        request = _Request(
-            taskType="TEXT_IMAGE",
-            textToImageParams=_TextToImageParams(text=self._prompt),
-            imageGenerationConfig=_ImageGenerationConfig(
-                width=self._width,
-                height=self._height,
-                numberOfImages=self._count,
-                seed=random_seed(),
-            ),
-        )
+        config: _ImageGenerationConfig = {
+            "width": self._width,
+            "height": self._height,
+            "numberOfImages": self._count,
+            "seed": random_seed(),
+        }
         if self._extra_params and "imageGenerationConfig" in self._extra_params:
-            request["imageGenerationConfig"].update(
-                self._extra_params["imageGenerationConfig"]  # type:ignore[typeddict-item]
-            )
+            config |= self._extra_params["imageGenerationConfig"]  # type:ignore[typeddict-item]
 
         self._response_height = self._height
         self._response_width = self._width
@@ -147,10 +148,15 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
 
         amz_quality = get_amz_quality(self._quality)
         if amz_quality:
-            request["imageGenerationConfig"]["quality"] = amz_quality
+            config["quality"] = amz_quality
             self._response_quality = "high" if amz_quality == "premium" else "medium"
 
-        return tuple(
+        request: _Request = {
+            "taskType": "TEXT_IMAGE",
+            "textToImageParams": {"text": self._prompt},
+            "imageGenerationConfig": config,
+        }
+        return (
             self._get_image_from_response(image, index)
             for index, image in enumerate((await self._model.invoke(request))["images"])
         )
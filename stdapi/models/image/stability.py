@@ -5,7 +5,9 @@
 - stability.stable-image-ultra-v1:1
 """
 
+from bisect import bisect_left
 from collections.abc import Awaitable, Iterable
+from itertools import pairwise
 from typing import Literal, NotRequired, TypedDict
 
 from fastapi import HTTPException
@@ -22,7 +24,7 @@ _AspectRatio = Literal[
 ]
 
 # Formats supported by the model
-_SUPPORTED_IMAGE_FORMATS = {"png", "jpeg"}
+_SUPPORTED_IMAGE_FORMATS = frozenset(("png", "jpeg"))
 
 _ASPECT_RATIOS: dict[float, _AspectRatio] = {
     16 / 9: "16:9",
@@ -36,6 +38,20 @@ _ASPECT_RATIOS: dict[float, _AspectRatio] = {
     9 / 21: "9:21",
 }
 
+# Supported aspect ratios in ascending order, and midpoints between consecutive
+# ratios: the number of midpoints below a ratio is the index of the nearest one
+_SORTED_RATIOS = tuple(_ASPECT_RATIOS[ratio] for ratio in sorted(_ASPECT_RATIOS))
+_SORTED_RATIOS_MIDPOINTS = tuple(
+    (low + high) / 2 for low, high in pairwise(sorted(_ASPECT_RATIOS))
+)
+
+# For a ratio exactly at a midpoint, True if the higher ratio wins the tie: the
+# first ratio in "_ASPECT_RATIOS" order is used
+_SORTED_RATIOS_TIE_HIGHER = tuple(
+    list(_ASPECT_RATIOS).index(high) < list(_ASPECT_RATIOS).index(low)
+    for low, high in pairwise(sorted(_ASPECT_RATIOS))
+)
+
 
 class _Request(TypedDict):
     """Stability AI request parameters."""
@@ -72,23 +88,26 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
                 detail='"quality" parameter is not supported by this model.',
             )
 
-        request = _Request(
-            prompt=self._prompt,
-            mode="text-to-image",
-            aspect_ratio=self._get_aspect_ratio(self._width, self._height),
-        )
-        request.update(self._extra_params)  # type:ignore[typeddict-item]
+        request: _Request = {
+            "prompt": self._prompt,
+            "mode": "text-to-image",
+            "aspect_ratio": self._get_aspect_ratio(self._width, self._height),
+        }
+        request |= self._extra_params  # type:ignore[typeddict-item]
 
         if self._style:
             request["style_preset"] = self._style
         if self._output_format:
-            if self._output_format not in _SUPPORTED_IMAGE_FORMATS:
-                self._response_output_format = "png"
+            self._response_output_format = (
+                self._output_format
+                if self._output_format in _SUPPORTED_IMAGE_FORMATS
+                else "png"
+            )
             request["output_format"] = self._response_output_format  # type: ignore[typeddict-item]
         else:
             self._response_output_format = "jpeg"
 
-        return tuple(
+        return (
             self._get_image_from_response(request, index)
             for index in range(self._count)
         )
@@ -110,18 +129,17 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
                 the request was filtered.
         """
         response = await self._model.invoke(request)
-        try:
-            finish_reasons = response["finish_reasons"]
-        except KeyError:
-            pass
-        else:
-            reasons = tuple(reason for reason in finish_reasons if reason)
+        finish_reasons = response.get("finish_reasons")
+        if finish_reasons:
+            reasons = {reason for reason in finish_reasons if reason}
             if reasons:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Request was filtered: {', '.join(set(reasons))}",
+                    detail=f"Request was filtered: {', '.join(reasons)}",
                 )
-        return ImageGenerationResponse(image=response["images"][0], index=index)
+        return ImageGenerationResponse.model_construct(
+            image=response["images"][0], index=index
+        )
 
     @staticmethod
     def _get_aspect_ratio(width: int, height: int) -> _AspectRatio:
@@ -135,7 +153,14 @@ class _ImageGenerationJob(ImageGenerationJobBase["ImageModel"]):
             Closest supported aspect ratio.
         """
         ratio = width / height
-        return _ASPECT_RATIOS[min(_ASPECT_RATIOS.keys(), key=lambda x: abs(x - ratio))]
+        index = bisect_left(_SORTED_RATIOS_MIDPOINTS, ratio)
+        if (
+            index < len(_SORTED_RATIOS_MIDPOINTS)
+            and _SORTED_RATIOS_MIDPOINTS[index] == ratio
+            and _SORTED_RATIOS_TIE_HIGHER[index]
+        ):
+            index += 1
+        return _SORTED_RATIOS[index]
 
 
 class ImageModel(ImageModelBase[_Request, _Response, _ImageGenerationJob]):
@@ -121,6 +121,28 @@ async def b64encode(value: Buffer, altchars: str | Buffer | None = None) -> str:
     return (await to_thread(_b64encode, value, altchars=altchars)).decode()
 
 
+#: JSON documents smaller than this size are parsed without a thread
+_JSON_LOADS_THREAD_MIN_SIZE = 65536
+
+
+async def json_loads(value: str | bytes) -> JsonValue:
+    """Parse a JSON document.
+
+    Large model outputs may take several milliseconds to parse, so they are
+    parsed in a separate thread to avoid blocking the event loop. Small
+    documents are parsed inline, where the thread overhead would dominate.
+
+    Args:
+        value: JSON document.
+
+    Returns:
+        The parsed JSON value.
+    """
+    if len(value) < _JSON_LOADS_THREAD_MIN_SIZE:
+        return from_json(value)  # type: ignore[no-any-return]
+    return await to_thread(from_json, value)
+
+
 #: PIL image formats
 _PilImageFormats = Literal["JPEG", "WEBP", "PNG"]
 
@@ -253,11 +275,25 @@ async def convert_base64_image(
     )
 
 
+def _get_base64_image_size(content: str | Buffer) -> tuple[int, int]:
+    """Calculates the dimensions of an image from its Base64-encoded content.
+
+    Args:
+        content: The Base64-encoded image content as a string or Buffer.
+
+    Returns:
+        A tuple containing the width and height of the image as integers.
+    """
+    with BytesIO(_b64decode(content)) as buffer, Image.open(buffer) as image:
+        return image.size  # type: ignore[no-any-return]
+
+
 async def get_base64_image_size(content: str | Buffer) -> tuple[int, int]:
     """Calculates the dimensions of an image from its Base64-encoded content.
 
     The function takes a Base64-encoded string or a Buffer containing an image,
     decodes it, and opens it as an image to retrieve its width and height.
+    Both steps run in a separate thread.
 
     Args:
         content: The Base64-encoded image content as a string or Buffer.
@@ -265,8 +301,7 @@ async def get_base64_image_size(content: str | Buffer) -> tuple[int, int]:
     Returns:
         A tuple containing the width and height of the image as integers.
     """
-    with BytesIO(await b64decode(content)) as buffer, Image.open(buffer) as image:
-        return image.size  # type: ignore[no-any-return]
+    return await to_thread(_get_base64_image_size, content)
 
 
 def webuuid() -> str:
@@ -318,6 +353,21 @@ def is_data_uri(string: str) -> bool:
     return _data_uri_matcher(string) is not None
 
 
+def get_data_uri_data(string: str) -> str | None:
+    """Return the data of a data URI.
+
+    Args:
+        string: The string to check
+
+    Returns:
+        Data following the data URI header, or None if not a data URI.
+    """
+    match = _data_uri_matcher(string)
+    if match is None:
+        return None
+    return string[match.end() :]
+
+
 def get_data_uri_type(string: str) -> str:
     """Return the media type of data URI or plain text.
 